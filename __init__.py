@@ -13,6 +13,8 @@ PLATFORMS: list[Platform] = [Platform.SENSOR]
 async def async_setup_entry(hass: HomeAssistant, entry) -> bool:
     """Set up BC Hydro from a config entry."""
     coordinator = BCHydroCoordinator(hass, entry)
+    # Registered first so the shared client is released on setup retries too
+    entry.async_on_unload(coordinator.async_close)
     await coordinator.async_config_entry_first_refresh()
     entry.async_on_unload(entry.add_update_listener(coordinator.async_update_listener))
     hass.data.setdefault("bchydro", {})[entry.entry_id] = coordinator
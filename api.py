@@ -1,23 +1,31 @@
 """BC Hydro API implementation."""
 import asyncio
 import logging
+import re
+from array import array
 from datetime import datetime
-from typing import Dict, Optional
+from html import unescape
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-from selenium.webdriver import ChromeOptions
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from seleniumwire import webdriver
+import aiohttp
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+from lxml.etree import XPath
 
 from .const import (
+    SSO_COOKIE,
+    URL_LOGIN_GOTO,
     URL_LOGIN_PAGE,
+    URL_POST_LOGIN,
+    REQUEST_TIMEOUT,
     USER_AGENT,
 )
 from .exceptions import (
+    BCHydroError,
     BCHydroAuthException,
     BCHydroInvalidHtmlException,
+    BCHydroInvalidDataException,
     BCHydroAlertDialogException,
 )
 from .types import (
@@ -30,203 +38,382 @@ from .types import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_BC_HYDRO_RATES = BCHydroRates(
+    step1_rate=0.0954,  # Current BC Hydro Step 1 rate
+    step2_rate=0.1427,  # Current BC Hydro Step 2 rate
+    threshold=1332.0,   # Current threshold in kWh
+)
+
+_ALERT_SELECTOR = CSSSelector(".alert.error:not(.hidden)")
+_HIDDEN_INPUT_XPATH = XPath("//input[@type='hidden'][@name]")
+_ACCOUNT_LINK_XPATH = XPath(
+    "(//*[contains(concat(' ', normalize-space(@class), ' '), ' accountListDiv ')])[1]"
+    "/descendant-or-self::*[@href][1]/@href"
+)
+_PROFILE_LINK_XPATH = XPath("//*[@id='ViewAndPayProfile']/ancestor-or-self::*[@href][1]/@href")
+_TABLE_XPATH = XPath("//*[@id='consumptionTable']")
+_ROW_XPATH = XPath("(.//tr)[position()>1]")  # Skip header row
+_CELL_XPATH = XPath("./td")
+_TABLE_CELLS_XPATH = XPath("(.//tr)[position()>1]/td")
+_OTHER_WIDTH_ROW_COUNT_XPATH = XPath("count((.//tr)[position()>1][count(td) != $width])")
+_FIRST_ROW_WIDTH_XPATH = XPath("count((.//tr)[2]/td)")
+
+# Byte-level fast path for the consumption table; rows need at least four cells
+_TABLE_START_RE = re.compile(rb"""id\s*=\s*["']?consumptionTable\b""")
+_TABLE_END_RE = re.compile(rb"</table", re.IGNORECASE)
+_TR_RE = re.compile(rb"<tr[\s>]", re.IGNORECASE)
+_ALERT_CLASS_RE = re.compile(rb"""class\s*=\s*["']([^"']*\balert\b[^"']*)["']""", re.IGNORECASE)
+_ROW_RE = re.compile(
+    rb"<tr[^>]*>\s*<td[^>]*>([^<]*)</td>\s*<td[^>]*>([^<]*)</td>"
+    rb"\s*<td[^>]*>([^<]*)</td>\s*<td",
+    re.IGNORECASE,
+)
+
+# Sent with every request, since a caller-provided session has its own defaults
+_HEADERS = {"User-Agent": USER_AGENT}
+_TIMEOUT = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+
+
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+
+def _iter_rows(table: lxml_html.HtmlElement) -> Iterator[List[str]]:
+    """Yield the cell texts of each data row in the table.
+
+    When every row has the width of the first one, all cells are fetched
+    with one query and sliced by that width; ragged tables fall back to
+    querying row by row.
+    """
+    width = int(_FIRST_ROW_WIDTH_XPATH(table))
+    if width and not _OTHER_WIDTH_ROW_COUNT_XPATH(table, width=width):
+        cells = [cell.text_content() for cell in _TABLE_CELLS_XPATH(table)]
+        for index in range(0, len(cells), width):
+            yield cells[index:index + width]
+        return
+
+    for row in _ROW_XPATH(table):
+        yield [cell.text_content() for cell in _CELL_XPATH(row)]
+
+
+def _scan_rows(html: bytes) -> List[Sequence[str]]:
+    """Return the date, consumption and cost cells of each table row.
+
+    Only rows whose cells hold plain text are matched. An empty result,
+    returned whenever a data row does not match, means the caller should
+    fall back to parsing the document.
+    """
+    table = _TABLE_START_RE.search(html)
+    if not table:
+        return []
+    start = table.end()
+    end_match = _TABLE_END_RE.search(html, start)
+    end = end_match.start() if end_match else len(html)
+    rows = [
+        [unescape(cell.decode("utf-8", "replace")) for cell in match.groups()]
+        for match in _ROW_RE.finditer(html, start, end)
+    ]
+    # Every row except the header must have matched
+    if len(rows) != len(_TR_RE.findall(html, start, end)) - 1:
+        return []
+    return rows
+
+
+def _has_visible_alert(html: bytes) -> bool:
+    """Return whether the page has a non-hidden ".alert.error" element."""
+    for match in _ALERT_CLASS_RE.finditer(html):
+        classes = match.group(1).split()
+        if b"alert" in classes and b"error" in classes and b"hidden" not in classes:
+            return True
+    return False
+
+
+def _parse_date(date_str: str) -> datetime:
+    """Parse a "%b %d, %Y" date without the overhead of strptime."""
+    month, day, year = date_str.replace(",", " ").split()
+    try:
+        return datetime(int(year), _MONTHS[month[:3].title()], int(day))
+    except KeyError as err:
+        raise ValueError(f"Unknown month: {month}") from err
+
+
 class BCHydroApi:
     """BC Hydro API client."""
 
-    def __init__(self, username: str, password: str) -> None:
-        """Initialize the API client."""
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
+        """Initialize the API client.
+
+        The session, if given, must have its own cookie jar; the client
+        takes ownership of it and closes it in close().
+        """
         self.username = username
         self.password = password
-        self._driver = None
+        self._session = session
         self._authenticated = False
+        # Page holding the consumption table, found while logging in
+        self._profile_url: Optional[str] = None
         
         # Cache for data
         self._account: Optional[BCHydroAccount] = None
         self._usage: Optional[BCHydroDailyUsage] = None
         self._latest_point: Optional[BCHydroDailyElectricity] = None
+        self.latest_interval: Dict = {
+            "start": None,
+            "end": None,
+            "billing_period_end": None,
+        }
 
-    async def _ensure_browser(self) -> None:
-        """Ensure browser is running."""
-        if not self._driver:
-            options = ChromeOptions()
-            options.add_argument('--headless')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument(f'user-agent={USER_AGENT}')
-            
-            # Set up wire options for better performance
-            wire_options = {
-                'connection_timeout': None  # Don't timeout
-            }
-            
-            self._driver = webdriver.Chrome(
-                options=options,
-                seleniumwire_options=wire_options
-            )
+    async def _ensure_session(self) -> None:
+        """Ensure the HTTP session is open."""
+        if not self._session or self._session.closed:
+            self._session = aiohttp.ClientSession(cookie_jar=aiohttp.CookieJar())
 
-    async def _authenticate(self) -> None:
+    async def authenticate(self) -> None:
         """Authenticate with BC Hydro."""
         if self._authenticated:
             return
 
-        await self._ensure_browser()
+        await self._ensure_session()
 
         try:
-            self._driver.get(URL_LOGIN_PAGE)
-
-            # Wait for and fill in login form
-            username_field = WebDriverWait(self._driver, 10).until(
-                EC.presence_of_element_located((By.ID, "username"))
-            )
-            password_field = self._driver.find_element(By.ID, "password")
-            submit_button = self._driver.find_element(By.ID, "loginSubmit")
+            # Pick up the session cookies and any hidden form fields
+            _, doc = await self._get_page(URL_LOGIN_PAGE)
+            form_data = {
+                field.get("name"): field.get("value", "")
+                for field in _HIDDEN_INPUT_XPATH(doc)
+            }
+            form_data.setdefault("gotoUrl", URL_LOGIN_GOTO)
+            form_data[self._field_name(doc, "username")] = self.username
+            form_data[self._field_name(doc, "password")] = self.password
 
-            username_field.send_keys(self.username)
-            password_field.send_keys(self.password)
-            submit_button.click()
+            async with self._session.post(
+                URL_POST_LOGIN, data=form_data, headers=_HEADERS, timeout=_TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                page_url = str(response.url)
+                page = lxml_html.fromstring(await response.read())
 
             # Check for error messages
-            try:
-                error_msg = WebDriverWait(self._driver, 3).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".alert.error:not(.hidden)"))
-                )
-                raise BCHydroAuthException(f"Login failed: {error_msg.text}")
-            except Exception:
-                pass  # No error message found, continue
+            self._check_for_errors(page)
+            if page_url.startswith(URL_POST_LOGIN) or not self._has_sso_cookie():
+                raise BCHydroAuthException("Login failed: no SSO session was created")
 
             # If multiple accounts, select first one
-            try:
-                account = WebDriverWait(self._driver, 3).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "accountListDiv"))
-                )
-                account.click()
-            except Exception:
-                pass  # No account selection needed
+            account_links = _ACCOUNT_LINK_XPATH(page)
+            if account_links:
+                page_url, page = await self._get_page(urljoin(page_url, account_links[0]))
+
+            profile_links = _PROFILE_LINK_XPATH(page)
+            if not profile_links:
+                raise BCHydroInvalidHtmlException("View and pay profile link not found")
+            self._profile_url = urljoin(page_url, profile_links[0])
 
             self._authenticated = True
 
+        except (BCHydroAuthException, BCHydroInvalidHtmlException):
+            # A missing profile link is a portal change, not bad credentials
+            self._authenticated = False
+            raise
+        except aiohttp.ClientResponseError as err:
+            self._authenticated = False
+            if err.status in (401, 403):
+                raise BCHydroAuthException(f"Authentication failed: {str(err)}") from err
+            raise BCHydroError(f"Cannot connect to BC Hydro: {str(err)}") from err
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            self._authenticated = False
+            raise BCHydroError(f"Cannot connect to BC Hydro: {str(err)}") from err
         except Exception as err:
             self._authenticated = False
             raise BCHydroAuthException(f"Authentication failed: {str(err)}") from err
 
     async def refresh(self) -> None:
         """Refresh account data."""
+        if self._session is None or self._session.closed:
+            # A closed session has lost its cookies; open a new one and log in
+            self._authenticated = False
         if not self._authenticated:
-            await self._authenticate()
+            await self.authenticate()
 
         try:
-            # Navigate to consumption page and wait for data
-            self._driver.find_element(By.ID, "ViewAndPayProfile").click()
-            WebDriverWait(self._driver, 10).until(
-                EC.presence_of_element_located((By.ID, "consumptionTableSection"))
-            )
-
-            # Get latest usage data
-            table_section = self._driver.find_element(By.ID, "consumptionTableSection")
-            table_html = table_section.get_attribute('outerHTML')
-            
-            soup = BeautifulSoup(table_html, "html.parser")
-            self._check_for_errors(soup)
+            # The HTML consumption table lives on the View & Pay profile page,
+            # as in the browser flow; the XML consumption endpoint is not used
+            async with self._session.get(
+                self._profile_url, headers=_HEADERS, timeout=_TIMEOUT
+            ) as response:
+                if response.status in (401, 403) or self._is_login_page(response):
+                    raise BCHydroAuthException("Session expired")
+                response.raise_for_status()
+                # lxml detects the encoding itself, so skip decoding to str
+                body = await response.read()
+
+            # Only build the tree when needed; it is shared with the parse fallback
+            doc = None
+            if _has_visible_alert(body):
+                doc = lxml_html.fromstring(body)
+                # Only alerts in the table section matter, as in the browser flow
+                self._check_for_errors(doc.get_element_by_id("consumptionTableSection", doc))
 
             # Parse consumption data
-            self._usage = self._parse_consumption_data(soup)
-            if self._usage and self._usage.electricity:
-                self._latest_point = self._usage.electricity[-1]
-
-        except Exception as err:
+            self._usage = self._parse_consumption_data(body, doc)
+            if self._usage:
+                self._latest_point = self._usage.latest
+            if self._latest_point:
+                interval = self._latest_point.interval
+                self.latest_interval = {
+                    "start": interval.start,
+                    "end": interval.end,
+                    "billing_period_end": interval.billing_period_end,
+                }
+
+        except BCHydroAuthException:
             self._authenticated = False
-            raise BCHydroAuthException(f"Failed to refresh data: {str(err)}") from err
-
-    def _check_for_errors(self, soup: BeautifulSoup) -> None:
+            raise
+        except BCHydroAlertDialogException as err:
+            if "sign in" in str(err).lower():
+                self._authenticated = False
+                raise BCHydroAuthException(f"Session expired: {str(err)}") from err
+            raise
+        except BCHydroInvalidHtmlException:
+            # An expired session may still answer 200 with a page lacking the
+            # table; a table without valid rows is BCHydroInvalidDataException
+            self._authenticated = False
+            raise
+        except BCHydroError:
+            raise
+        except Exception as err:
+            # Transient failure; keep the session for the next refresh
+            raise BCHydroError(f"Failed to refresh data: {str(err)}") from err
+
+    def _has_sso_cookie(self) -> bool:
+        """Return whether the SSO server has issued a session cookie."""
+        return any(cookie.key == SSO_COOKIE for cookie in self._session.cookie_jar)
+
+    async def _get_page(self, url: str) -> Tuple[str, lxml_html.HtmlElement]:
+        """Fetch a page, returning its final URL and parsed document."""
+        async with self._session.get(url, headers=_HEADERS, timeout=_TIMEOUT) as response:
+            response.raise_for_status()
+            return str(response.url), lxml_html.fromstring(await response.read())
+
+    @staticmethod
+    def _is_login_page(response: aiohttp.ClientResponse) -> bool:
+        """Return whether a response was redirected back to the login page."""
+        url = str(response.url)
+        return url.startswith(URL_LOGIN_PAGE) or url.startswith(URL_POST_LOGIN)
+
+    @staticmethod
+    def _field_name(doc: lxml_html.HtmlElement, field_id: str) -> str:
+        """Return the form name of a login field, defaulting to its id."""
+        field = doc.get_element_by_id(field_id, None)
+        return field.get("name", field_id) if field is not None else field_id
+
+    def _check_for_errors(self, doc: lxml_html.HtmlElement) -> None:
         """Check for error messages in the HTML."""
-        alerts = soup.select(".alert.error:not(.hidden)")
+        alerts = _ALERT_SELECTOR(doc)
         if alerts:
-            error_msg = " ".join(alert.get_text(strip=True) for alert in alerts)
+            error_msg = " ".join(alert.text_content().strip() for alert in alerts)
             raise BCHydroAlertDialogException(f"Alert dialog detected: {error_msg}")
 
-    def _parse_consumption_data(self, soup: BeautifulSoup) -> BCHydroDailyUsage:
-        """Parse consumption data from HTML."""
-        table = soup.find(id="consumptionTable")
-        if not table:
-            raise BCHydroInvalidHtmlException("Consumption table not found")
-
-        # Parse consumption rows
-        electricity = []
-        for row in table.find_all("tr")[1:]:  # Skip header row
-            cells = row.find_all("td")
-            if len(cells) < 4:
-                continue
-
-            date_str = cells[0].get_text(strip=True)
+    def _parse_consumption_data(
+        self, html: bytes, doc: Optional[lxml_html.HtmlElement] = None
+    ) -> BCHydroDailyUsage:
+        """Parse consumption data from the raw HTML response.
+
+        doc is the already parsed response, if any; it is only built here
+        when the regex scan does not cover the table.
+        """
+        rows = _scan_rows(html)
+        if not rows:
+            if doc is None:
+                doc = lxml_html.fromstring(html)
+            tables = _TABLE_XPATH(doc)
+            if not tables:
+                raise BCHydroInvalidHtmlException("Consumption table not found")
+            rows = [cells for cells in _iter_rows(tables[0]) if len(cells) >= 4]
+
+        # Parse consumption rows into columns
+        consumptions = []
+        costs = []
+        dates = []
+        # float() and _parse_date() tolerate surrounding whitespace
+        for cells in rows:
+            date_str = cells[0]
             try:
-                consumption = float(cells[1].get_text(strip=True))
-                cost = float(cells[2].get_text(strip=True).replace("$", "").strip())
+                consumption = float(cells[1])
+                cost = float(cells[2].strip().replace("$", ""))
             except ValueError:
                 continue  # Skip rows with invalid numbers
                 
             try:
-                date = datetime.strptime(date_str, "%b %d, %Y")
+                date = _parse_date(date_str)
             except ValueError:
                 continue  # Skip rows with invalid dates
 
-            interval = BCHydroInterval(
-                start=date,
-                end=date,
-            )
+            consumptions.append(consumption)
+            costs.append(cost)
+            dates.append(date)
 
-            electricity.append(
-                BCHydroDailyElectricity(
-                    consumption=consumption,
-                    cost=cost,
-                    interval=interval,
-                )
-            )
-
-        if not electricity:
-            raise BCHydroInvalidHtmlException("No valid consumption data found")
+        if not dates:
+            raise BCHydroInvalidDataException("No valid consumption data found")
 
         # Create usage object
         return BCHydroDailyUsage(
             account=self._account,
             interval=BCHydroInterval(
-                start=electricity[0].interval.start,
-                end=electricity[-1].interval.end,
-            ),
-            rates=BCHydroRates(
-                step1_rate=0.0954,  # Current BC Hydro Step 1 rate
-                step2_rate=0.1427,  # Current BC Hydro Step 2 rate
-                threshold=1332.0,   # Current threshold in kWh
+                start=dates[0],
+                end=dates[-1],
             ),
-            electricity=electricity,
+            rates=_BC_HYDRO_RATES,
+            consumption_arr=array("d", consumptions),
+            cost_arr=array("d", costs),
+            start_arr=tuple(dates),
         )
 
+    @property
+    def latest_usage(self) -> float:
+        """Latest usage value from the last refresh."""
+        return self._latest_point.consumption if self._latest_point else 0.0
+
+    @property
+    def latest_cost(self) -> float:
+        """Latest cost value from the last refresh."""
+        return self._latest_point.cost if self._latest_point else 0.0
+
     async def get_latest_usage(self) -> float:
         """Get latest usage value."""
         if not self._latest_point:
             await self.refresh()
-        return self._latest_point.consumption if self._latest_point else 0.0
+        return self.latest_usage
 
     async def get_latest_cost(self) -> float:
         """Get latest cost value."""
         if not self._latest_point:
             await self.refresh()
-        return self._latest_point.cost if self._latest_point else 0.0
+        return self.latest_cost
 
     async def get_latest_interval(self) -> Dict:
         """Get latest interval information."""
         if not self._latest_point:
             await self.refresh()
-        return {
-            "start": self._latest_point.interval.start if self._latest_point else None,
-            "end": self._latest_point.interval.end if self._latest_point else None,
-            "billing_period_end": self._latest_point.interval.billing_period_end if self._latest_point else None,
-        }
+        return self.latest_interval
 
     async def __aenter__(self):
         """Async enter."""
         return self
 
+    async def close(self) -> None:
+        """Close the HTTP session."""
+        if self._session:
+            await self._session.close()
+            self._session = None
+        self._authenticated = False
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async exit."""
-        if self._driver:
-            self._driver.quit()
+        await self.close()
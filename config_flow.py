@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import logging
+
+import aiohttp
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
@@ -9,6 +12,21 @@ from homeassistant.data_entry_flow import FlowResult
 
 from .const import DOMAIN
 from .api import BCHydroApi
+from .exceptions import BCHydroAuthException, BCHydroError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def _validate_credentials(username: str, password: str) -> bool:
+    """Return whether the credentials can log in to BC Hydro."""
+    # The client closes this session on exit
+    session = aiohttp.ClientSession(cookie_jar=aiohttp.CookieJar())
+    async with BCHydroApi(username, password, session) as api:
+        try:
+            await api.authenticate()
+        except BCHydroAuthException:
+            return False
+    return True
 
 
 class BCHydroConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -25,16 +43,19 @@ class BCHydroConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             password = user_input["password"]
 
             try:
-                # Validate credentials using the BCHydroApi
-                api = BCHydroApi(username, password)
-                await api.refresh()
-
-                # If successful, create the entry
-                return self.async_create_entry(
-                    title="BC Hydro",
-                    data={"username": username, "password": password},
-                )
+                # Only log in; fetching usage data is not needed to validate
+                valid = await _validate_credentials(username, password)
+            except BCHydroError:
+                errors["base"] = "cannot_connect"
             except Exception:
+                _LOGGER.exception("Unexpected error validating BC Hydro credentials")
+                errors["base"] = "unknown"
+            else:
+                if valid:
+                    return self.async_create_entry(
+                        title="BC Hydro",
+                        data={"username": username, "password": password},
+                    )
                 errors["base"] = "invalid_auth"
 
         data_schema = vol.Schema(
@@ -9,6 +9,8 @@ USER_AGENT = "https://github.com/dipakparmar/homeassistant_bchydro"
 URL_LOGIN_PAGE = "https://app.bchydro.com/BCHCustomerPortal/web/login.html"
 URL_POST_LOGIN = "https://app.bchydro.com/sso/UI/Login"
 URL_LOGIN_GOTO = "https://app.bchydro.com:443/BCHCustomerPortal/web/login.html"
+# Session cookie set by the SSO server after a successful login
+SSO_COOKIE = "iPlanetDirectoryPro"
 
 # Account related URLs
 URL_GET_ACCOUNTS = "https://app.bchydro.com/BCHCustomerPortal/web/getAccounts.html"
@@ -18,6 +20,7 @@ URL_POST_CONSUMPTION_XML = "https://app.bchydro.com/evportlet/web/consumption-da
 
 # Time constants in seconds
 FIVE_MINUTES = 300
+REQUEST_TIMEOUT = 30
 
 # Period constants
 ENUM_CURRENT_BILLING_PERIOD = "Current billing period"
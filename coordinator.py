@@ -2,15 +2,75 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
+import hashlib
 import logging
 
+import aiohttp
+
 from .api import BCHydroApi
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 _LOGGER = logging.getLogger(__name__)
 UPDATE_INTERVAL = timedelta(minutes=5)
+# Window in seconds for other entries to join a pending refresh
+BATCH_WINDOW = 0.25
+
+
+class _PendingRefreshes:
+    """Share API clients and coalesce refreshes across config entries."""
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._apis: dict[str, BCHydroApi] = {}
+        self._users: dict[str, int] = {}
+        self._pending: dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def key(username: str, password: str) -> str:
+        """Return the registry key for a set of credentials."""
+        return hashlib.sha256(f"{username}\0{password}".encode()).hexdigest()
+
+    def acquire(
+        self, hass: HomeAssistant, key: str, username: str, password: str
+    ) -> BCHydroApi:
+        """Return the shared API client for key, creating it if needed."""
+        if key not in self._apis:
+            # Not tied to the entry being set up; release() closes it
+            session = async_create_clientsession(
+                hass, auto_cleanup=False, cookie_jar=aiohttp.CookieJar()
+            )
+            self._apis[key] = BCHydroApi(username, password, session)
+        self._users[key] = self._users.get(key, 0) + 1
+        return self._apis[key]
+
+    async def release(self, key: str) -> None:
+        """Drop a user of the client for key, closing it when unused."""
+        self._users[key] -= 1
+        if not self._users[key]:
+            del self._users[key]
+            await self._apis.pop(key).close()
+
+    async def refresh(self, key: str) -> None:
+        """Refresh the client for key, joining a refresh already pending."""
+        if key not in self._pending:
+            self._pending[key] = asyncio.ensure_future(self._refresh(key))
+        await asyncio.shield(self._pending[key])
+
+    async def _refresh(self, key: str) -> None:
+        """Wait for other entries to join, then refresh once."""
+        api = self._apis[key]
+        try:
+            await asyncio.sleep(BATCH_WINDOW)
+            await api.refresh()
+        finally:
+            self._pending.pop(key, None)
+
+
+_PENDING_REFRESHES = _PendingRefreshes()
 
 
 class BCHydroCoordinator(DataUpdateCoordinator):
@@ -24,16 +84,25 @@ class BCHydroCoordinator(DataUpdateCoordinator):
             name="BC Hydro",
             update_interval=UPDATE_INTERVAL,
         )
-        self.api = BCHydroApi(entry.data["username"], entry.data["password"])
+        username = entry.data["username"]
+        password = entry.data["password"]
+        self._api_key = _PENDING_REFRESHES.key(username, password)
+        self.api = _PENDING_REFRESHES.acquire(
+            hass, self._api_key, username, password
+        )
+
+    async def async_close(self) -> None:
+        """Release the API client."""
+        await _PENDING_REFRESHES.release(self._api_key)
 
     async def _async_update_data(self):
         """Fetch data from BC Hydro."""
         try:
-            await self.api.refresh()
+            await _PENDING_REFRESHES.refresh(self._api_key)
             return {
-                "latest_usage": await self.api.get_latest_usage(),
-                "latest_cost": await self.api.get_latest_cost(),
-                "billing_period_end": (await self.api.get_latest_interval()).get("billing_period_end"),
+                "latest_usage": self.api.latest_usage,
+                "latest_cost": self.api.latest_cost,
+                "billing_period_end": self.api.latest_interval["billing_period_end"],
             }
         except Exception as err:
             raise UpdateFailed(f"Error fetching data: {err}") from err
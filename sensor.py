@@ -2,30 +2,35 @@
 
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorEntity
+from operator import itemgetter
+
+from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.const import ENERGY_KILO_WATT_HOUR, CURRENCY_DOLLAR, ATTR_DATE
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import BCHydroCoordinator
 
 
-SENSOR_TYPES = {
-    "latest_usage": {
-        "name": "Latest Usage",
-        "unit_of_measurement": ENERGY_KILO_WATT_HOUR,
-        "icon": "mdi:flash",
-    },
-    "latest_cost": {
-        "name": "Latest Cost",
-        "unit_of_measurement": CURRENCY_DOLLAR,
-        "icon": "mdi:currency-usd",
-    },
-    "billing_period_end": {
-        "name": "Billing Period End",
-        "unit_of_measurement": ATTR_DATE,
-        "icon": "mdi:calendar",
-    },
-}
+SENSORS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key="latest_usage",
+        name="Latest Usage",
+        native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
+        icon="mdi:flash",
+    ),
+    SensorEntityDescription(
+        key="latest_cost",
+        name="Latest Cost",
+        native_unit_of_measurement=CURRENCY_DOLLAR,
+        icon="mdi:currency-usd",
+    ),
+    SensorEntityDescription(
+        key="billing_period_end",
+        name="Billing Period End",
+        native_unit_of_measurement=ATTR_DATE,
+        icon="mdi:calendar",
+    ),
+)
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -33,8 +38,8 @@ async def async_setup_entry(hass, entry, async_add_entities):
     coordinator: BCHydroCoordinator = hass.data["bchydro"][entry.entry_id]
 
     sensors = [
-        BCHydroSensor(coordinator, sensor_type)
-        for sensor_type in SENSOR_TYPES
+        BCHydroSensor(coordinator, description)
+        for description in SENSORS
     ]
     async_add_entities(sensors)
 
@@ -42,15 +47,15 @@ async def async_setup_entry(hass, entry, async_add_entities):
 class BCHydroSensor(CoordinatorEntity, SensorEntity):
     """Representation of a BC Hydro sensor."""
 
-    def __init__(self, coordinator: BCHydroCoordinator, sensor_type: str) -> None:
+    def __init__(
+        self, coordinator: BCHydroCoordinator, description: SensorEntityDescription
+    ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._sensor_type = sensor_type
-        self._attr_name = SENSOR_TYPES[sensor_type]["name"]
-        self._attr_unit_of_measurement = SENSOR_TYPES[sensor_type]["unit_of_measurement"]
-        self._attr_icon = SENSOR_TYPES[sensor_type]["icon"]
+        self.entity_description = description
+        self._getter = itemgetter(description.key)
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        return self.coordinator.data.get(self._sensor_type)
+        return self._getter(self.coordinator.data) if self.coordinator.data else None
@@ -1,17 +1,46 @@
 """BC Hydro API types."""
 
+from array import array
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, TypedDict, Any
+from typing import List, Optional, Dict, Sequence, Tuple, TypedDict, Any
 
-@dataclass
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; costs are computed on plain arrays
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        """Return the function unchanged when Numba is unavailable."""
+        return lambda func: func
+
+
+@njit(cache=True)
+def _tiered_cost(
+    consumption: Sequence[float],
+    costs: Sequence[float],
+    step1_rate: float,
+    step2_rate: float,
+    threshold: float,
+) -> None:
+    """Fill costs per reading under a two-step rate with a cumulative threshold."""
+    total = 0.0
+    for i in range(len(consumption)):
+        step1 = min(max(threshold - total, 0.0), consumption[i])
+        costs[i] = step1 * step1_rate + (consumption[i] - step1) * step2_rate
+        total += consumption[i]
+
+@dataclass(frozen=True, slots=True)
 class BCHydroRates:
     """Rate information."""
     step1_rate: float
     step2_rate: float
     threshold: float
 
-@dataclass
+@dataclass(slots=True)
 class BCHydroInterval:
     """Time interval for consumption data."""
     start: datetime
@@ -21,7 +50,7 @@ class BCHydroInterval:
     def __repr__(self) -> str:
         return f"BCHydroInterval(start={self.start}, end={self.end})"
 
-@dataclass
+@dataclass(slots=True)
 class BCHydroDailyElectricity:
     """Daily electricity usage data."""
     consumption: float
@@ -37,7 +66,7 @@ class BCHydroAccountData(TypedDict):
     accountStatus: str
     address: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True)
 class BCHydroAccount:
     """Account information."""
     account_id: str
@@ -57,10 +86,51 @@ class BCHydroAccount:
             address=data["address"],
         )
 
-@dataclass
+@dataclass(slots=True)
 class BCHydroDailyUsage:
     """Daily usage data."""
     account: BCHydroAccount
     interval: BCHydroInterval
     rates: BCHydroRates
-    electricity: List[BCHydroDailyElectricity]
+    consumption_arr: array  # kWh per day, typecode "d"
+    cost_arr: array  # dollars per day, typecode "d"
+    start_arr: Tuple[datetime, ...]  # day of each reading
+
+    def _point(self, index: int) -> BCHydroDailyElectricity:
+        """Build the electricity point at the given index."""
+        start = self.start_arr[index]
+        return BCHydroDailyElectricity(
+            consumption=float(self.consumption_arr[index]),
+            cost=float(self.cost_arr[index]),
+            interval=BCHydroInterval(start=start, end=start),
+        )
+
+    @property
+    def electricity(self) -> List[BCHydroDailyElectricity]:
+        """Daily electricity points, rebuilt from the arrays on access."""
+        return [self._point(index) for index in range(len(self.start_arr))]
+
+    def compute_costs(self) -> Sequence[float]:
+        """Compute the step 1/step 2 cost of each reading from the rates.
+
+        Returns a NumPy array when NumPy is installed, otherwise an array.
+        """
+        if np is not None:
+            consumption = np.frombuffer(self.consumption_arr, dtype=np.float64)
+            costs = np.empty_like(consumption)
+        else:
+            consumption = self.consumption_arr
+            costs = array("d", consumption)
+        _tiered_cost(
+            consumption,
+            costs,
+            self.rates.step1_rate,
+            self.rates.step2_rate,
+            self.rates.threshold,
+        )
+        return costs
+
+    @property
+    def latest(self) -> Optional[BCHydroDailyElectricity]:
+        """Most recent electricity point, if any."""
+        return self._point(-1) if len(self.start_arr) else None